@@ -1,8 +1,14 @@
+from models.user import ERR_UNKNOWN_USER  # Re-exported for command handlers
 from storage.repository import Repository
 
+# Error responses shared by all command handlers
+ERR_INVALID_ARGUMENTS = "Error - invalid arguments"
+
 
 class Command:
     """Base class for all command handlers."""
 
     def __init__(self, storage: Repository):
         self.storage = storage
+        # Direct reference for the per-command user check (hot path)
+        self._users = storage.users
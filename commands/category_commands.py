@@ -1,6 +1,11 @@
-from commands.base import Command
+from commands.base import Command, ERR_INVALID_ARGUMENTS, ERR_UNKNOWN_USER
 from models.category import Category
-from models.user import User
+from models.listing import Listing
+
+ERR_CATEGORY_NOT_FOUND = "Error - category not found"
+ERR_INVALID_SORT_TYPE = "Error - invalid sort type"
+ERR_INVALID_SORT_ORDER = "Error - invalid sort order"
+ERR_NO_CATEGORIES = "Error - no categories found"
 
 
 class CategoryCommand(Command):
@@ -20,41 +25,44 @@ class CategoryCommand(Command):
             Multi-line listing output or error message
         """
         if len(args) != 4:
-            return "Error - invalid arguments"
+            return ERR_INVALID_ARGUMENTS
 
         username, category_name, sort_type, order = args
 
-        # Check if user exists using model method
-        if not User.exists(username, self.storage):
-            return "Error - unknown user"
+        # Check if user exists
+        if username.lower() not in self._users:
+            return ERR_UNKNOWN_USER
 
         # Get category using model method
         category = Category.get_by_name(category_name, self.storage)
         if not category:
-            return "Error - category not found"
+            return ERR_CATEGORY_NOT_FOUND
 
         # Get listings using model method
         listings = category.get_listings(self.storage)
 
         if not listings:
-            return "Error - category not found"
+            return ERR_CATEGORY_NOT_FOUND
 
-        # Sort based on parameters using model methods
+        # Pick the sort key
         if sort_type == "sort_price":
-            listings.sort(key=lambda x: x.get_sort_key_price())
+            sort_key = Listing.SORT_KEY_PRICE
         elif sort_type == "sort_time":
-            listings.sort(key=lambda x: x.get_sort_key_time())
+            sort_key = Listing.SORT_KEY_TIME
         else:
-            return "Error - invalid sort type"
+            return ERR_INVALID_SORT_TYPE
+
+        # Validate order
+        if order != "asc" and order != "dsc":
+            return ERR_INVALID_SORT_ORDER
 
-        # Apply order
+        # Sort ascending, then reverse for dsc (equal keys come out newest-first)
+        listings.sort(key=sort_key)
         if order == "dsc":
             listings.reverse()
-        elif order != "asc":
-            return "Error - invalid sort order"
 
         # Format output (one listing per line)
-        return "\n".join(listing.to_output_string() for listing in listings)
+        return "\n".join([listing.to_output_string() for listing in listings])
 
     def get_top_category(self, *args) -> str:
         """
@@ -67,18 +75,18 @@ class CategoryCommand(Command):
             "<category>" or "Error - unknown user"
         """
         if len(args) != 1:
-            return "Error - invalid arguments"
+            return ERR_INVALID_ARGUMENTS
 
         username = args[0]
 
-        # Check if user exists using model method
-        if not User.exists(username, self.storage):
-            return "Error - unknown user"
+        # Check if user exists
+        if username.lower() not in self._users:
+            return ERR_UNKNOWN_USER
 
         # Call model method to get top category
         top_category = Category.get_top_category(self.storage)
 
         if not top_category:
-            return "Error - no categories found"
+            return ERR_NO_CATEGORIES
 
         return top_category
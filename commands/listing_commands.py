@@ -1,6 +1,18 @@
-from commands.base import Command
+from functools import lru_cache
+
+from commands.base import Command, ERR_INVALID_ARGUMENTS, ERR_UNKNOWN_USER
 from models.listing import Listing
-from models.user import User
+
+ERR_INVALID_LISTING_ID = "Error - invalid listing ID"
+ERR_NOT_FOUND = "Error - not found"
+ERR_LISTING_DOES_NOT_EXIST = "Error - listing does not exist"
+ERR_LISTING_OWNER_MISMATCH = "Error - listing owner mismatch"
+
+
+@lru_cache(maxsize=4096)
+def _parse_listing_id(listing_id_str: str) -> int:
+    """Parse a listing ID, memoized for repeated lookups of the same listing."""
+    return int(listing_id_str)
 
 
 class ListingCommand(Command):
@@ -21,20 +33,15 @@ class ListingCommand(Command):
             "<listing_id>" or "Error - unknown user"
         """
         if len(args) != 5:
-            return "Error - invalid arguments"
+            return ERR_INVALID_ARGUMENTS
 
         username, title, description, price_str, category = args
 
-        try:
-            # Call model method which handles validation, business logic, and persistence
-            listing = Listing.create(username, title, description, price_str, category, self.storage)
-            return str(listing.listing_id)
-        except ValueError as e:
-            error_msg = str(e)
-            # Return the error message as-is if it starts with "Error -"
-            if error_msg.startswith("Error -"):
-                return error_msg
-            return f"Error - {e}"
+        # Call model method which handles validation, business logic, and persistence
+        listing, error = Listing.try_create(username, title, description, price_str, category, self.storage)
+        if error:
+            return error
+        return str(listing.listing_id)
 
     def get_listing(self, *args) -> str:
         """
@@ -49,24 +56,24 @@ class ListingCommand(Command):
             or error message
         """
         if len(args) != 2:
-            return "Error - invalid arguments"
+            return ERR_INVALID_ARGUMENTS
 
         username, listing_id_str = args
 
-        # Check if user exists using model method
-        if not User.exists(username, self.storage):
-            return "Error - unknown user"
+        # Check if user exists
+        if username.lower() not in self._users:
+            return ERR_UNKNOWN_USER
 
         # Parse listing ID
         try:
-            listing_id = int(listing_id_str)
+            listing_id = _parse_listing_id(listing_id_str)
         except ValueError:
-            return "Error - invalid listing ID"
+            return ERR_INVALID_LISTING_ID
 
         # Get listing using model method
         listing = Listing.get_by_id(listing_id, self.storage)
         if not listing:
-            return "Error - not found"
+            return ERR_NOT_FOUND
 
         return listing.to_output_string()
 
@@ -82,28 +89,29 @@ class ListingCommand(Command):
             "Success", "Error - listing does not exist", or "Error - listing owner mismatch"
         """
         if len(args) != 2:
-            return "Error - invalid arguments"
+            return ERR_INVALID_ARGUMENTS
 
         username, listing_id_str = args
+        username_key = username.lower()
 
-        # Check if user exists using model method
-        if not User.exists(username, self.storage):
-            return "Error - unknown user"
+        # Check if user exists
+        if username_key not in self._users:
+            return ERR_UNKNOWN_USER
 
         # Parse listing ID
         try:
-            listing_id = int(listing_id_str)
+            listing_id = _parse_listing_id(listing_id_str)
         except ValueError:
-            return "Error - invalid listing ID"
+            return ERR_INVALID_LISTING_ID
 
         # Get listing using model method
         listing = Listing.get_by_id(listing_id, self.storage)
         if not listing:
-            return "Error - listing does not exist"
+            return ERR_LISTING_DOES_NOT_EXIST
 
         # Validate ownership using model method
-        if not listing.is_owned_by(username):
-            return "Error - listing owner mismatch"
+        if not listing.is_owned_by(username_key):
+            return ERR_LISTING_OWNER_MISMATCH
 
         # Delete listing using model method
         listing.delete(self.storage)
@@ -1,6 +1,8 @@
-from commands.base import Command
+from commands.base import Command, ERR_INVALID_ARGUMENTS
 from models.user import User
 
+ERR_USER_ALREADY_EXISTING = "Error - user already existing"
+
 
 class UserCommand(Command):
     """Handler for all user-related commands."""
@@ -16,7 +18,7 @@ class UserCommand(Command):
             "Success" or "Error - user already existing"
         """
         if len(args) != 1:
-            return "Error - invalid arguments"
+            return ERR_INVALID_ARGUMENTS
 
         username = args[0]
 
@@ -24,7 +26,6 @@ class UserCommand(Command):
             # Call model method which handles business logic and persistence
             User.register(username, self.storage)
             return "Success"
-        except ValueError as e:
-            if "already exists" in str(e):
-                return "Error - user already existing"
-            return f"Error - {e}"
+        except ValueError:
+            # register() only raises when the user already exists
+            return ERR_USER_ALREADY_EXISTING
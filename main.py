@@ -12,6 +12,15 @@ from commands.user_commands import UserCommand
 from commands.listing_commands import ListingCommand
 from commands.category_commands import CategoryCommand
 
+# Prefix for unexpected errors raised while running a command
+ERR_PREFIX = "Error - "
+
+# Response for a command name with no handler (filled in with the name)
+ERR_UNKNOWN_COMMAND = "Error - unknown command '{}'"
+
+# Batch-mode output is written to stdout in chunks of this many responses
+OUTPUT_CHUNK_SIZE = 1024
+
 
 def main():
     """Main application loop."""
@@ -23,7 +32,7 @@ def main():
     listing_cmd = ListingCommand(storage)
     category_cmd = CategoryCommand(storage)
 
-    # Map commands to controller methods
+    # Map commands to controller methods (lookup bound once, outside the loop)
     commands = {
         "REGISTER": user_cmd.register,
         "CREATE_LISTING": listing_cmd.create_listing,
@@ -32,6 +41,7 @@ def main():
         "GET_CATEGORY": category_cmd.get_category,
         "GET_TOP_CATEGORY": category_cmd.get_top_category,
     }
+    dispatch = commands.get
 
     # Initialize parser
     parser = CommandParser()
@@ -40,6 +50,19 @@ def main():
     is_interactive = sys.stdin.isatty()
     prompt = "# " if is_interactive else ""
 
+    # Responses (one entry each) are collected and written in chunks,
+    # every response when interactive
+    pending = []
+    write = pending.append
+    chunk_size = 1 if is_interactive else OUTPUT_CHUNK_SIZE
+
+    def flush_output():
+        """Write collected responses to stdout."""
+        if pending:
+            sys.stdout.write("".join(pending))
+            pending.clear()
+        sys.stdout.flush()
+
     # Main STDIN loop
     try:
         while True:
@@ -59,19 +82,26 @@ def main():
             try:
                 # Parse command
                 cmd_name, args = parser.parse(line)
-
+            except ValueError as e:
+                # Handle parsing errors (e.g., unclosed quotes); the message is the full response
+                handler = None
+                write(str(e) + "\n")
+            else:
                 # Check if command exists
-                if cmd_name not in commands:
-                    print(f"Error - unknown command '{cmd_name}'")
-                    continue
+                handler = dispatch(cmd_name)
+                if handler is None:
+                    write(ERR_UNKNOWN_COMMAND.format(cmd_name) + "\n")
 
-                # Execute command method
-                result = commands[cmd_name](*args)
-                print(result)
+            if handler is not None:
+                try:
+                    # Execute command method
+                    write(handler(*args) + "\n")
+                except ValueError as e:
+                    # Unexpected value errors from a command (e.g., a NaN price on output)
+                    write(ERR_PREFIX + str(e) + "\n")
 
-            except ValueError as e:
-                # Handle parsing errors (e.g., unclosed quotes)
-                print(f"Error - {e}")
+            if len(pending) >= chunk_size:
+                flush_output()
 
     except EOFError:
         # Handle Ctrl+D (EOF)
@@ -79,9 +109,13 @@ def main():
 
     except KeyboardInterrupt:
         # Handle Ctrl+C
-        print()  # Print newline for clean exit
+        write("\n")  # Print newline for clean exit
         sys.exit(0)
 
+    finally:
+        # Write out pending responses however the loop ends
+        flush_output()
+
 
 if __name__ == "__main__":
     main()
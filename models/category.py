@@ -1,32 +1,57 @@
 from dataclasses import dataclass, field
-from typing import Set, List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from storage.repository import Repository
     from models.listing import Listing
 
 
+class _DescendingName:
+    """Rank key wrapper that orders category names alphabetically descending."""
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __lt__(self, other: '_DescendingName') -> bool:
+        return self.name > other.name
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _DescendingName) and self.name == other.name
+
+
 @dataclass
 class Category:
     """Represents a category in the marketplace with business logic."""
     name: str
-    listing_ids: Set[int] = field(default_factory=set)
+    # Listings held directly (no ID re-lookup on reads), in insertion order
+    listings: Dict[int, 'Listing'] = field(default_factory=dict)  # key: listing_id
 
-    def add_listing(self, listing_id: int):
+    def add_listing(self, listing: 'Listing'):
         """Add a listing to this category."""
-        self.listing_ids.add(listing_id)
+        self.listings[listing.listing_id] = listing
 
     def remove_listing(self, listing_id: int):
         """Remove a listing from this category."""
-        self.listing_ids.discard(listing_id)
+        self.listings.pop(listing_id, None)
 
     def get_listing_count(self) -> int:
         """Get the number of listings in this category."""
-        return len(self.listing_ids)
+        return len(self.listings)
 
     def has_listings(self) -> bool:
         """Check if this category has any listings."""
-        return len(self.listing_ids) > 0
+        return len(self.listings) > 0
+
+    def rank_key(self) -> Tuple[int, _DescendingName, int, str]:
+        """
+        Sort key ranking categories for GET_TOP_CATEGORY (smallest ranks first).
+
+        Most listings first; ties go to the alphabetically later name.
+        Ends with (listing_count, name) so a stored key can be checked for staleness.
+        """
+        count = len(self.listings)
+        return (-count, _DescendingName(self.name), count, self.name)
 
     @staticmethod
     def get_by_name(name: str, repo: 'Repository') -> Optional['Category']:
@@ -47,17 +72,12 @@ class Category:
         Get all listings in this category.
 
         Args:
-            repo: Repository to fetch listings from
+            repo: Repository to fetch listings from (unused; listings are held directly)
 
         Returns:
-            List of Listing objects
+            A new list of Listing objects, safe for the caller to sort
         """
-        listings = []
-        for listing_id in self.listing_ids:
-            listing = repo.get_listing(listing_id)
-            if listing:
-                listings.append(listing)
-        return listings
+        return list(self.listings.values())
 
     @staticmethod
     def get_top_category(repo: 'Repository') -> Optional[str]:
@@ -70,17 +90,14 @@ class Category:
         Returns:
             Category name or None
         """
-        categories = repo.get_all_categories()
-        if not categories:
-            return None
-
-        # Filter categories that have listings
-        categories_with_listings = [(name, cat.get_listing_count())
-                                    for name, cat in categories.items()
-                                    if cat.has_listings()]
-
-        if not categories_with_listings:
-            return None
-
-        # Use count as primary key, category name (alphabetically later) as tiebreaker
-        return max(categories_with_listings, key=lambda x: (x[1], x[0]))[0]
+        # The repository keeps a heap of rank keys pushed on every save; skip
+        # entries whose count no longer matches the category
+        while True:
+            entry = repo.peek_category_rank()
+            if entry is None:
+                return None
+            _, _, count, name = entry
+            category = repo.get_category(name)
+            if category is not None and category.get_listing_count() == count:
+                return name
+            repo.pop_category_rank()
@@ -1,25 +1,59 @@
-from dataclasses import dataclass
+import sys
 from datetime import datetime
-from typing import Optional, TYPE_CHECKING
+from functools import lru_cache
+from operator import attrgetter
+from typing import Optional, Tuple, TYPE_CHECKING
+
+from models.user import ERR_UNKNOWN_USER
 
 if TYPE_CHECKING:
     from storage.repository import Repository
 
+ERR_INVALID_PRICE = "Error - invalid price"
+
+
+@lru_cache(maxsize=4096)
+def _parse_price(price: str) -> Optional[float]:
+    """Parse a price string (None if invalid), memoized since the same prices recur often."""
+    try:
+        return float(price)
+    except (ValueError, TypeError):
+        return None
+
 
-@dataclass
 class Listing:
     """Represents a listing in the marketplace with business logic."""
-    listing_id: int
-    username: str
-    title: str
-    description: str
-    price: float
-    category: str
-    creation_time: datetime
+    # Plain slotted class rather than a dataclass: listings are created on
+    # every CREATE_LISTING, so __init__ is kept to direct slot assignments
+    __slots__ = (
+        "listing_id", "username", "title", "description", "price", "category", "creation_time",
+        "username_lower",  # Cached ownership key
+        "creation_ts",  # Unix time, cheap to compare when sorting
+        "_formatted_time",  # Cached creation timestamp
+        "_output",  # Output line, built on first use (listings are immutable)
+    )
+
+    # Sort keys for GET_CATEGORY, resolved in C rather than through a Python call per listing
+    SORT_KEY_PRICE = attrgetter("price")
+    SORT_KEY_TIME = attrgetter("creation_ts")
+
+    def __init__(self, listing_id: int, username: str, title: str, description: str,
+                 price: float, category: str, creation_time: datetime):
+        self.listing_id = listing_id
+        self.username = username
+        self.title = title
+        self.description = description
+        self.price = price
+        self.category = category
+        self.creation_time = creation_time
+        self.username_lower = username.lower()
+        self.creation_ts = creation_time.timestamp()
+        self._formatted_time = creation_time.strftime("%Y-%m-%d %H:%M:%S")
+        self._output = None
 
     @staticmethod
-    def create(username: str, title: str, description: str,
-               price: float, category: str, repo: 'Repository') -> 'Listing':
+    def try_create(username: str, title: str, description: str, price: float,
+                   category: str, repo: 'Repository') -> Tuple[Optional['Listing'], Optional[str]]:
         """
         Create a new listing with validation and persist to repository.
 
@@ -32,23 +66,21 @@ class Listing:
             repo: Repository for persistence
 
         Returns:
-            The newly created Listing
-
-        Raises:
-            ValueError: If price is invalid or user doesn't exist
+            (listing, None) on success, or (None, "Error - ...") on failure
         """
         # Validate price
-        try:
-            price_float = float(price)
-        except (ValueError, TypeError):
-            raise ValueError("Error - invalid price")
-        if price_float < 0:
-            raise ValueError("Error - invalid price")
+        price_float = _parse_price(price)
+        if price_float is None or price_float < 0:
+            return None, ERR_INVALID_PRICE
 
         # Check if user exists
         user = repo.get_user(username)
         if not user:
-            raise ValueError("Error - unknown user")
+            return None, ERR_UNKNOWN_USER
+
+        # Share one string object per distinct category/username across listings
+        category = sys.intern(category)
+        username = sys.intern(username)
 
         # Get listing ID
         listing_id = repo.get_next_listing_id()
@@ -61,7 +93,7 @@ class Listing:
             description=description,
             price=price_float,
             category=category,
-            creation_time=datetime.now()
+            creation_time=repo.now()
         )
 
         # Save to repository
@@ -76,10 +108,10 @@ class Listing:
         category_obj = repo.get_category(category)
         if not category_obj:
             category_obj = Category(name=category)
-        category_obj.add_listing(listing_id)
+        category_obj.add_listing(listing)
         repo.save_category(category_obj)
 
-        return listing
+        return listing, None
 
     @staticmethod
     def get_by_id(listing_id: int, repo: 'Repository') -> Optional['Listing']:
@@ -106,7 +138,7 @@ class Listing:
             True if successful
         """
         # Update user aggregate
-        user = repo.get_user(self.username)
+        user = repo.get_user(self.username_lower)
         if user:
             user.remove_listing(self.listing_id)
             repo.save_user(user)
@@ -122,22 +154,21 @@ class Listing:
 
         return True
 
-    def is_owned_by(self, username: str) -> bool:
-        """Check if this listing belongs to the given user (case-insensitive)."""
-        return self.username.lower() == username.lower()
-
-    def get_sort_key_price(self) -> float:
-        """Get the sort key for price-based sorting."""
-        return self.price
-
-    def get_sort_key_time(self) -> datetime:
-        """Get the sort key for time-based sorting."""
-        return self.creation_time
+    def is_owned_by(self, username_key: str) -> bool:
+        """Check if this listing belongs to the given user (expects a lowercased username)."""
+        return self.username_lower == username_key
 
     def format_time(self) -> str:
         """Returns formatted timestamp in YYYY-MM-DD HH:MM:SS format."""
-        return self.creation_time.strftime("%Y-%m-%d %H:%M:%S")
+        return self._formatted_time
 
     def to_output_string(self) -> str:
         """Returns the listing formatted for output."""
-        return f"{self.title}|{self.description}|{int(self.price)}|{self.format_time()}|{self.category}|{self.username}"
+        output = self._output
+        if output is None:
+            # Built lazily so creation never fails on formatting. price stays a
+            # float so fractional prices still sort correctly; its integer form
+            # is only needed here and is formatted once
+            output = self._output = (f"{self.title}|{self.description}|{int(self.price)}|"
+                                     f"{self._formatted_time}|{self.category}|{self.username}")
+        return output
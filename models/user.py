@@ -4,16 +4,22 @@ from typing import Set, TYPE_CHECKING
 if TYPE_CHECKING:
     from storage.repository import Repository
 
+ERR_UNKNOWN_USER = "Error - unknown user"
+
 
 @dataclass
 class User:
     """Represents a user aggregate in the marketplace with business logic."""
     username: str  # Original casing preserved
     listing_ids: Set[int] = field(default_factory=set)
+    username_lower: str = field(init=False, repr=False)  # Cached lookup key
+
+    def __post_init__(self):
+        self.username_lower = self.username.lower()
 
     def username_key(self) -> str:
         """Returns normalized username for case-insensitive lookups."""
-        return self.username.lower()
+        return self.username_lower
 
     def add_listing(self, listing_id: int):
         """Add a listing created by this user."""
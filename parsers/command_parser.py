@@ -1,6 +1,58 @@
-import shlex
+import re
 from typing import Tuple, List
 
+# A whole token: bare characters, backslash escapes and quoted sections
+# (adjacent parts join into one token, as in POSIX shells). A lone quote or
+# trailing backslash falls through to the second group and is an error.
+# Only shlex's whitespace (space, tab, CR, LF) separates tokens; other
+# Unicode spaces such as NBSP are ordinary characters.
+_TOKEN_RE = re.compile(
+    r"""((?:[^ \t\r\n'"\\]+|\\.|"(?:[^"\\]|\\.)*"|'[^']*')+)|([^ \t\r\n])""",
+    re.DOTALL,
+)
+
+# The parts of a token that needs unquoting
+_PART_RE = re.compile(
+    r"""([^ \t\r\n'"\\]+)|\\(.)|"((?:[^"\\]|\\.)*)"|'([^']*)'""",
+    re.DOTALL,
+)
+
+# Inside double quotes, backslash only escapes a quote or another backslash
+_DOUBLE_QUOTE_ESCAPE_RE = re.compile(r'\\([\\"])')
+
+_SPECIAL_CHARS = frozenset("'\"\\")
+
+# Tokenizing errors, worded as shlex reports them
+ERR_NO_CLOSING_QUOTATION = "Error - Invalid command format: No closing quotation"
+ERR_NO_ESCAPED_CHARACTER = "Error - Invalid command format: No escaped character"
+
+
+def _unquote(token: str) -> str:
+    """Strip quotes and resolve escapes in a token containing special characters."""
+    parts = []
+    for bare, escaped, double_quoted, single_quoted in _PART_RE.findall(token):
+        if bare:
+            parts.append(bare)
+        elif escaped:
+            parts.append(escaped)
+        elif double_quoted:
+            parts.append(_DOUBLE_QUOTE_ESCAPE_RE.sub(r"\1", double_quoted))
+        else:
+            parts.append(single_quoted)
+    return "".join(parts)
+
+
+def _describe_error(remainder: str) -> str:
+    """Pick the tokenizing error message, given the text from the stray character on."""
+    if remainder == "\\":
+        return ERR_NO_ESCAPED_CHARACTER
+    if remainder[0] == '"':
+        # Unclosed double quote ending mid-escape
+        trailing = len(remainder) - len(remainder.rstrip("\\"))
+        if trailing % 2:
+            return ERR_NO_ESCAPED_CHARACTER
+    return ERR_NO_CLOSING_QUOTATION
+
 
 class CommandParser:
     """Parses command-line input with support for quoted strings."""
@@ -9,23 +61,30 @@ class CommandParser:
         """
         Parse a command line with quoted string support.
 
-        Uses shlex for POSIX-compliant parsing:
+        Uses a precompiled tokenizer with POSIX shell quoting rules:
         - Handles quotes: "multi word title"
         - Handles escaped quotes: "She said \\"hello\\""
         - Handles single and double quotes
 
         Returns:
             Tuple of (command_name, args_list)
+
+        Raises:
+            ValueError: On unclosed quotes or a trailing escape character
         """
-        try:
-            tokens = shlex.split(input_line)
-            if not tokens:
-                return ("", [])
-
-            command = tokens[0].upper()
-            args = tokens[1:]
-            return (command, args)
-
-        except ValueError as e:
-            # Handle unclosed quotes or other parsing errors
-            raise ValueError(f"Invalid command format: {e}")
+        tokens = []
+        for match in _TOKEN_RE.finditer(input_line):
+            token, stray = match.groups()
+            if stray:
+                raise ValueError(_describe_error(input_line[match.start():]))
+            if _SPECIAL_CHARS.isdisjoint(token):
+                tokens.append(token)
+            else:
+                tokens.append(_unquote(token))
+
+        if not tokens:
+            return ("", [])
+
+        command = tokens[0].upper()
+        args = tokens[1:]
+        return (command, args)
@@ -1,9 +1,17 @@
-from typing import Optional, Dict
+import heapq
+import time
+from datetime import datetime, timedelta
+from typing import Optional, Dict, List, Tuple
 from models.user import User
 from models.listing import Listing
 from models.category import Category
 
 
+# How long a converted datetime is reused for new listing timestamps
+_CONVERSION_TTL = 0.001
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
 class Repository:
     """Simple data repository - pure data storage with no business logic."""
 
@@ -12,10 +20,17 @@ class Repository:
         self.users: Dict[str, User] = {}  # key: username.lower()
         self.listings: Dict[int, Listing] = {}  # key: listing_id
         self.categories: Dict[str, Category] = {}  # key: category name
+        # Heap of Category.rank_key() entries, pushed on every save; may hold
+        # stale entries, which Category.get_top_category skips
+        self._category_counts: List[Tuple] = []
 
         # ID generation
         self.next_listing_id: int = 100001
 
+        # Listing timestamps (see now())
+        self._converted_at: float = float("-inf")
+        self._last_time: datetime = datetime.min
+
     # User repository methods
     def save_user(self, user: User):
         """Save a user to storage."""
@@ -49,15 +64,47 @@ class Repository:
         self.next_listing_id += 1
         return listing_id
 
+    def now(self) -> datetime:
+        """
+        Get a creation timestamp for a new listing.
+
+        The wall clock is read on every call, but the datetime conversion is
+        cached: a new datetime is built at most once per millisecond, and in
+        between the previous timestamp is advanced by a microsecond so that
+        timestamps stay strictly increasing.
+        """
+        t = time.time()
+        if t - self._converted_at >= _CONVERSION_TTL:
+            self._converted_at = t
+            current = datetime.fromtimestamp(t)
+            if current > self._last_time:
+                self._last_time = current
+                return current
+        self._last_time += _ONE_MICROSECOND
+        return self._last_time
+
     # Category repository methods
     def save_category(self, category: Category):
         """Save a category to storage."""
         self.categories[category.name] = category
+        if category.has_listings():
+            heapq.heappush(self._category_counts, category.rank_key())
+            if len(self._category_counts) > 2 * len(self.categories) + 64:
+                self._rebuild_category_counts()
 
     def get_category(self, name: str) -> Optional[Category]:
         """Get a category by name."""
         return self.categories.get(name)
 
-    def get_all_categories(self) -> Dict[str, Category]:
-        """Get all categories."""
-        return dict(self.categories)
+    def peek_category_rank(self) -> Optional[Tuple]:
+        """Get the smallest entry of the category rank heap, or None if empty."""
+        return self._category_counts[0] if self._category_counts else None
+
+    def pop_category_rank(self):
+        """Remove the smallest entry of the category rank heap."""
+        heapq.heappop(self._category_counts)
+
+    def _rebuild_category_counts(self):
+        """Rebuild the category rank heap from current categories, dropping stale entries."""
+        self._category_counts = [cat.rank_key() for cat in self.categories.values() if cat.has_listings()]
+        heapq.heapify(self._category_counts)